@@ -1,8 +1,15 @@
+import html
+import os
+import re
 import streamlit as st
 import pandas as pd
 import gspread
 from google.oauth2.service_account import Credentials
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from consensus import crowd_consensus
+import tabcache
+from postindex import PostIndex, row_hashes
+from seasons import all_time_rankings, first_archived_at, player_streaks, upsert_season, write_parquet_atomic
 
 # ----------------------------
 # CONFIG
@@ -51,6 +58,25 @@ st.markdown("""
 """, unsafe_allow_html=True)
 SHEET_NAME = "secret-santa-data"  # your exact sheet title
 
+# Optional cache shared by every replica (SQLite file on a shared volume).
+# Leave SHARED_CACHE_PATH unset in secrets to keep the per-process cache only.
+REVISION_PROBE_TTL = 15   # seconds one spreadsheet modified-time probe is reused
+TAB_TTL = 180             # worst-case staleness of a tab read, end to end
+STATE_TTL = 60            # same for app_state flags (lock / reveal)
+
+# The in-process st.cache_data copy, the shared SQLite copy and the probe stack
+# on top of each other, so they split the budget instead of each taking all of it.
+SHARED_CACHE_ON = bool(str(st.secrets.get("SHARED_CACHE_PATH", "")).strip())
+LOCAL_TAB_TTL = 30 if SHARED_CACHE_ON else TAB_TTL - REVISION_PROBE_TTL
+LOCAL_STATE_TTL = 10 if SHARED_CACHE_ON else STATE_TTL - REVISION_PROBE_TTL
+SHARED_TAB_TTL = TAB_TTL - LOCAL_TAB_TTL - REVISION_PROBE_TTL
+SHARED_STATE_TTL = STATE_TTL - LOCAL_STATE_TTL - REVISION_PROBE_TTL
+
+# Frozen past seasons: <ARCHIVE_DIR>/<season>/<tab>.parquet plus small
+# precomputed aggregate tables that the History page reads. ARCHIVE_DIR must
+# be set in secrets and point at the shared volume every replica mounts.
+ARCHIVE_TABS = ["players", "assignments", "guesses", "posts", "votes", "superlatives", "bingo", "app_state"]
+
 st.markdown("""
 <style>
 .bingo-header{
@@ -115,11 +141,54 @@ def open_sheet():
     client = gspread.authorize(creds)
     return client.open(SHEET_NAME)
 
-@st.cache_data(ttl=180, show_spinner=False)  # 3 minutes
-def read_tab(tab_name: str) -> pd.DataFrame:
+# ----------------------------
+# SHARED READ CACHE (MULTI-REPLICA)
+# ----------------------------
+@st.cache_resource
+def shared_cache_path() -> str:
+    path = str(st.secrets.get("SHARED_CACHE_PATH", "")).strip()
+    if path:
+        tabcache.init_shared_cache(path)
+    return path
+
+def fetch_records(tab_name: str) -> list:
     sh = open_sheet()  # uses cached resource
-    ws = sh.worksheet(tab_name)
-    return pd.DataFrame(ws.get_all_records())
+    return sh.worksheet(tab_name).get_all_records()
+
+@st.cache_data(ttl=REVISION_PROBE_TTL, show_spinner=False)
+def sheet_revision() -> str:
+    """Spreadsheet modifiedTime from Drive: one tiny request shared by every tab."""
+    return tabcache.sheet_modified_time(open_sheet())
+
+@st.cache_resource
+def local_fetches() -> dict:
+    # tab -> (revision, records) of the last download in this process
+    return {}
+
+def shared_records(tab_name: str, ttl: int) -> list:
+    fetch = lambda: fetch_records(tab_name)
+    path = shared_cache_path()
+    if not path:
+        return tabcache.local_records(local_fetches(), tab_name, fetch, sheet_revision)
+    return tabcache.shared_records(path, tab_name, ttl, fetch, sheet_revision)
+
+def invalidate_tab(tab_name: str):
+    """Call after writing a tab: this replica's next read downloads it, and other
+    replicas do once their short in-process copy (LOCAL_TAB_TTL) expires."""
+    try:
+        read_tab.clear(tab_name)
+    except TypeError:  # Streamlit without per-key clear
+        read_tab.clear()
+    if tab_name == "posts":
+        read_posts.clear()
+    local_fetches().pop(tab_name, None)
+    path = shared_cache_path()
+    if path:
+        tabcache.invalidate_shared(path, tab_name)
+
+@st.cache_data(ttl=LOCAL_TAB_TTL, show_spinner=False)
+def read_tab(tab_name: str) -> pd.DataFrame:
+    return pd.DataFrame(shared_records(tab_name, ttl=SHARED_TAB_TTL))
     
 def utc_iso():
     return datetime.now(timezone.utc).isoformat()
@@ -141,6 +210,8 @@ def set_state(sh, key: str, value: str):
     
     else:
         ws.append_row([key, value])
+    invalidate_tab("app_state")
+    get_state.clear()  # the host sees their own toggle right away
       
 def toggle_locked(sh):
     new_val = "FALSE" if is_locked() else "TRUE"
@@ -150,16 +221,21 @@ def toggle_locked(sh):
 def add_post(sh, player: str, content: str):
     ws = sh.worksheet("posts")
     ws.append_row([utc_iso(), player, content])
+    invalidate_tab("posts")
+
+# ----------------------------
+# CLUE WALL SEARCH INDEX
+# ----------------------------
+@st.cache_data(ttl=LOCAL_TAB_TTL, show_spinner=False)
+def read_posts() -> tuple:
+    """posts tab plus its per-row hashes, hashed once per refresh rather than per rerun."""
+    df = pd.DataFrame(shared_records("posts", ttl=SHARED_TAB_TTL))
+    return df, row_hashes(df)
+
+@st.cache_resource
+def post_index() -> PostIndex:
+    return PostIndex()
 
-    
-def get_posts(sh, limit: int = 100) -> pd.DataFrame:
-    df = read_tab("posts")
-    if df.empty:
-        return df
-    # newest first if timestamp exists
-    if "timestamp" in df.columns:
-        df = df.sort_values("timestamp", ascending=False)
-    return df.head(limit)
 def get_assignments_df() -> pd.DataFrame:
     df = read_tab("assignments")
     # expects receiver, giver
@@ -170,10 +246,9 @@ def get_assignments_df() -> pd.DataFrame:
     return df
 
 def compute_scores() -> pd.DataFrame:
-    guesses = read_tab("guesses")
-    assign = get_assignments_df()
-    players = read_tab("players")
+    return score_guesses(read_tab("guesses"), get_assignments_df(), read_tab("players"))
 
+def score_guesses(guesses: pd.DataFrame, assign: pd.DataFrame, players: pd.DataFrame) -> pd.DataFrame:
     if guesses.empty or assign.empty or players.empty:
         return pd.DataFrame(columns=["player", "correct", "total", "accuracy"])
 
@@ -215,6 +290,16 @@ def compute_scores() -> pd.DataFrame:
     score = score.sort_values(["correct", "accuracy"], ascending=[False, False]).reset_index(drop=True)
     return score
 
+@st.cache_data(show_spinner=False, max_entries=8)
+def _crowd_consensus(guesses: pd.DataFrame, names: tuple) -> pd.DataFrame:
+    # keyed on the guesses frame itself: the solve only reruns when guesses change
+    return crowd_consensus(guesses, list(names))
+
+def compute_crowd_consensus() -> pd.DataFrame:
+    players = read_tab("players")
+    names = tuple(players["name"].astype(str).str.strip().unique()) if not players.empty else ()
+    return _crowd_consensus(read_tab("guesses"), names)
+
 def get_active_superlatives() -> pd.DataFrame:
     df = read_tab("superlatives")
     if df.empty:
@@ -241,9 +326,12 @@ def upsert_vote(sh, voter: str, category: str, nominee: str):
         ws.update(f"A{target_row}:D{target_row}", [row_values])
     else:
         ws.append_row(row_values)
+    invalidate_tab("votes")
 
 def compute_superlative_results() -> pd.DataFrame:
-    votes = read_tab("votes")
+    return tally_votes(read_tab("votes"))
+
+def tally_votes(votes: pd.DataFrame) -> pd.DataFrame:
     if votes.empty:
         return pd.DataFrame(columns=["category", "nominee", "votes"])
 
@@ -254,13 +342,128 @@ def compute_superlative_results() -> pd.DataFrame:
     res = res.sort_values(["category", "votes"], ascending=[True, False]).reset_index(drop=True)
     return res
 # ----------------------------
+# SEASON ARCHIVE
+# ----------------------------
+SEASON_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9_-]{0,31}")
+
+def archive_dir() -> str:
+    return str(st.secrets.get("ARCHIVE_DIR", "")).strip()
+
+def clean_season(label: str) -> str:
+    """The stripped label if it is safe as a single directory name, else ""."""
+    label = (label or "").strip()
+    return label if SEASON_RE.fullmatch(label) else ""
+
+def archive_season(season: str):
+    """Freeze every tab into <archive>/<season>/ and refresh the all-time aggregates."""
+    root = archive_dir()
+    if not root or not clean_season(season):
+        raise ValueError(f"Cannot archive season {season!r} (ARCHIVE_DIR={root!r})")
+    season_dir = os.path.join(root, season)
+    os.makedirs(season_dir, exist_ok=True)
+
+    frames = {}
+    for tab in ARCHIVE_TABS:
+        df = pd.DataFrame(fetch_records(tab))  # fresh, not the cached copy
+        frames[tab] = df
+        frozen = df.drop(columns=["passcode"], errors="ignore").astype(str)
+        write_parquet_atomic(frozen, os.path.join(season_dir, f"{tab}.parquet"))
+
+    assign = frames["assignments"].copy()
+    if not assign.empty:
+        assign["receiver"] = assign["receiver"].astype(str).str.strip()
+        assign["giver"] = assign["giver"].astype(str).str.strip()
+    # re-archiving a season keeps its original place in the timeline
+    archived_at = first_archived_at(os.path.join(root, "season_scores.parquet"), season, utc_iso())
+
+    scores = score_guesses(frames["guesses"].copy(), assign, frames["players"].copy())
+    scores["rank"] = range(1, len(scores) + 1)
+    scores.insert(0, "season", season)
+    scores.insert(1, "archived_at", archived_at)
+
+    res = tally_votes(frames["votes"].copy())
+    winners = res.drop_duplicates("category").copy()
+    winners.insert(0, "season", season)
+    winners.insert(1, "archived_at", archived_at)
+
+    for name, new_rows in [("season_scores", scores), ("season_winners", winners)]:
+        upsert_season(os.path.join(root, f"{name}.parquet"), season, new_rows)
+
+def archived_seasons() -> list:
+    root = archive_dir()
+    if not os.path.isdir(root):
+        return []
+    return sorted(d for d in os.listdir(root) if os.path.isdir(os.path.join(root, d)))
+
+def _aggregate_mtime(name: str) -> float:
+    if not archive_dir():
+        return 0.0
+    path = os.path.join(archive_dir(), f"{name}.parquet")
+    return os.path.getmtime(path) if os.path.exists(path) else 0.0
+
+@st.cache_data(show_spinner=False)
+def _read_aggregate(name: str, mtime: float) -> pd.DataFrame:
+    # mtime is only part of the cache key, so a new archive busts the cache
+    if not mtime:
+        return pd.DataFrame()
+    return pd.read_parquet(os.path.join(archive_dir(), f"{name}.parquet"))
+
+def read_aggregate(name: str) -> pd.DataFrame:
+    return _read_aggregate(name, _aggregate_mtime(name))
+
+# ----------------------------
+# HTML RENDER (CACHED PER DATA VERSION)
+# ----------------------------
+# Each renderer takes a plain tuple of the values it shows, so that tuple is
+# the data version: markup is rebuilt only when what it displays changes.
+@st.cache_data(show_spinner=False, max_entries=64)
+def podium_html(podium: tuple) -> str:
+    """podium = ((player, correct, total, accuracy), ...) for 1st, 2nd, 3rd."""
+    cols = []
+    # order: 2nd, 1st, 3rd for classic podium look
+    for emoji, place, bar_class in [("🥈", 1, "two"), ("🥇", 0, "one"), ("🥉", 2, "three")]:
+        name, correct, total, accuracy = podium[place]
+        acc = f"{int(round(accuracy*100))}% accuracy" if total else "—"
+        cols.append(
+            '<div class="pcol"><div class="pcard">'
+            f'<div class="pname">{emoji} {html.escape(str(name))}</div>'
+            f'<div class="pscore">{correct}</div>'
+            f'<div class="prank">{acc}</div>'
+            f'</div><div class="bar {bar_class}"></div></div>'
+        )
+    return '<div class="podium-wrap"><div class="podium">' + "".join(cols) + "</div></div>"
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def superlative_cards_html(winners: tuple) -> str:
+    """winners = ((category, nominee, votes), ...) in display order."""
+    cards = []
+    for cat, nominee, v in winners:
+        cards.append(
+            '<div style="border:1px solid rgba(255,255,255,0.18); border-radius:18px; padding:14px; margin:10px 0;'
+            ' background: rgba(255,255,255,0.03);">'
+            f'<div style="font-weight:900; font-size:18px;">🏅 {html.escape(str(cat))}</div>'
+            f'<div style="font-size:22px; font-weight:900; margin-top:6px;">{html.escape(str(nominee))}</div>'
+            f'<div style="opacity:.8; margin-top:6px;">Votes: <b>{v}</b></div>'
+            '</div>'
+        )
+    return "".join(cards)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def bingo_square_html(person: str, stamped: bool) -> str:
+    cls = "square stamped" if stamped else "square"
+    return (
+        f'<div class="{cls}"><div>'
+        f'<div class="label">{html.escape(person)}</div>'
+        f'<div class="status">{"✅ STAMPED" if stamped else "⬜ not yet"}</div>'
+        '</div><div class="small-note">Tap below to toggle</div></div>'
+    )
+
+# ----------------------------
 # APP STATE (LOCK)
 # ----------------------------
-@st.cache_data(ttl=60, show_spinner=False)
+@st.cache_data(ttl=LOCAL_STATE_TTL, show_spinner=False)
 def get_state(key: str, default="FALSE") -> str:
-    sh = open_sheet()
-    ws = sh.worksheet("app_state")
-    rows = ws.get_all_records()
+    rows = shared_records("app_state", ttl=SHARED_STATE_TTL)
     for r in rows:
         if str(r.get("key", "")).strip().lower() == key.lower():
             return str(r.get("value", default)).strip()
@@ -338,6 +541,7 @@ def set_bingo_square(sh, player: str, square_id: str, checked: bool):
         ws.update(f"A{target_row}:D{target_row}", [row_values])
     else:
         ws.append_row(row_values)
+    invalidate_tab("bingo")
 
 
 # ----------------------------
@@ -363,6 +567,7 @@ def upsert_guess(sh, player: str, giver_guess: str, receiver_guess: str, confide
         ws.update(f"A{target_row}:F{target_row}", [row_values])
     else:
         ws.append_row(row_values)
+    invalidate_tab("guesses")
 
     
 def get_my_guesses(sh, player: str) -> pd.DataFrame:
@@ -419,6 +624,37 @@ def page_admin(sh):
         st.success("Updated reveal_superlatives ✅")
         st.rerun()
 
+    st.subheader("🕵️ Crowd Detective")
+    st.caption("The single most likely full assignment, based on everyone's guesses weighted by confidence.")
+    crowd = compute_crowd_consensus()
+    if crowd.empty:
+        st.write("Not enough players yet.")
+    else:
+        show = crowd.copy()
+        show["certainty"] = (show["certainty"] * 100).round(0).astype(int).astype(str) + "%"
+        st.dataframe(show[["receiver", "giver", "certainty", "support"]], hide_index=True, use_container_width=True)
+
+    st.subheader("📦 Archive Season")
+    season = clean_season(st.text_input("Season label", value=str(datetime.now().year)))
+    # History shows archived scores and winners to everyone, so only archive revealed results
+    revealed = reveal_scores_on() and reveal_superlatives_on()
+    ready = bool(archive_dir()) and revealed
+    if not archive_dir():
+        st.info("Set `ARCHIVE_DIR` in secrets to a folder on the shared volume to enable archiving.")
+    elif not revealed:
+        st.info("Reveal both scores and superlatives before archiving the season.")
+    elif not season:
+        st.warning("Season label: letters, digits, - and _ only (e.g. 2025).")
+    exists = bool(season) and season in archived_seasons()
+    overwrite = st.checkbox("Overwrite existing archive", value=False) if exists else True
+    if exists:
+        st.warning(f"Season {season} is already archived.")
+
+    if st.button("Archive season", disabled=not (ready and season and overwrite)):
+        with st.spinner("Freezing every tab…"):
+            archive_season(season)
+        st.success(f"Archived season {season} ✅")
+
     st.divider()
     st.caption("When locked is TRUE, nobody can save or edit guesses.")
 
@@ -499,17 +735,33 @@ def page_clue_wall(sh):
     st.divider()
 
     st.subheader("Feed")
-    posts = get_posts(sh, limit=200)
+    index = post_index()
+    index.sync(*read_posts())
 
-    if posts.empty:
+    if not len(index):
         st.write("No posts yet. Start the chaos 👀")
         return
 
+    windows = {"Any time": None, "Last hour": timedelta(hours=1), "Last 24 hours": timedelta(days=1)}
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        query = st.text_input("Search clues", placeholder="e.g. shrim", key="clue_search")
+    with col2:
+        authors = st.multiselect("Author", index.author_names(), key="clue_authors")
+    with col3:
+        window = st.selectbox("When", list(windows), key="clue_window")
+
+    since = datetime.now(timezone.utc) - windows[window] if windows[window] else None
+    hits = index.search(query, authors, since)
+    if query.strip() or authors or since:
+        st.caption(f"{len(hits)} matching post(s)")
+    if not hits:
+        st.write("No matching posts.")
+        return
+
     # Pretty feed cards
-    for _, row in posts.iterrows():
-        ts = str(row.get("timestamp", "")).replace("T", " ").replace("+00:00", " UTC")
-        who = row.get("player", "Unknown")
-        text = row.get("content", "")
+    for raw_ts, who, text in hits[:200]:
+        ts = raw_ts.replace("T", " ").replace("+00:00", " UTC")
 
         with st.container(border=True):
             st.write(f"**{who}**")
@@ -534,69 +786,11 @@ def page_leaderboard():
     while len(top) < 3:
         top = pd.concat([top, pd.DataFrame([{"player":"—", "correct":0, "total":0, "accuracy":0.0}])], ignore_index=True)
 
-    first, second, third = top.iloc[0], top.iloc[1], top.iloc[2]
-
-    st.markdown('<div class="podium-wrap">', unsafe_allow_html=True)
-    st.markdown("""
-    <div class="podium">
-      <div class="pcol">
-        <div class="pcard">
-          <div class="pname">🥈 {name}</div>
-          <div class="pscore">{score}</div>
-          <div class="prank">{acc}</div>
-        </div>
-        <div class="bar two"></div>
-      </div>
-      <div class="pcol">
-        <div class="pcard">
-          <div class="pname">🥇 {name}</div>
-          <div class="pscore">{score}</div>
-          <div class="prank">{acc}</div>
-        </div>
-        <div class="bar one"></div>
-      </div>
-      <div class="pcol">
-        <div class="pcard">
-          <div class="pname">🥉 {name}</div>
-          <div class="pscore">{score}</div>
-          <div class="prank">{acc}</div>
-        </div>
-        <div class="bar three"></div>
-      </div>
-    </div>
-    """.format(
-        name=second["player"], score=int(second["correct"]),
-        acc=f"{int(round(second['accuracy']*100))}% accuracy" if int(second["total"]) else "—"
-    ) + "" , unsafe_allow_html=True)
-
-    # The above format call only filled second; easiest is to render 3 separately:
-    st.markdown('</div>', unsafe_allow_html=True)
-
-    # Render properly (simple approach)
-    st.markdown('<div class="podium-wrap">', unsafe_allow_html=True)
-    st.markdown('<div class="podium">', unsafe_allow_html=True)
-
-    def podium_col(emoji, row, bar_class):
-        name = row["player"]
-        score = int(row["correct"])
-        acc = f"{int(round(row['accuracy']*100))}% accuracy" if int(row["total"]) else "—"
-        st.markdown(f"""
-        <div class="pcol">
-          <div class="pcard">
-            <div class="pname">{emoji} {name}</div>
-            <div class="pscore">{score}</div>
-            <div class="prank">{acc}</div>
-          </div>
-          <div class="bar {bar_class}"></div>
-        </div>
-        """, unsafe_allow_html=True)
-
-    # order: 2nd, 1st, 3rd for classic podium look
-    podium_col("🥈", second, "two")
-    podium_col("🥇", first, "one")
-    podium_col("🥉", third, "three")
-
-    st.markdown("</div></div>", unsafe_allow_html=True)
+    podium = tuple(
+        (str(r["player"]), int(r["correct"]), int(r["total"]), float(r["accuracy"]))
+        for _, r in top.iterrows()
+    )
+    st.markdown(podium_html(podium), unsafe_allow_html=True)
 
     st.divider()
     st.subheader("Full Rankings")
@@ -604,6 +798,32 @@ def page_leaderboard():
     show["accuracy"] = (show["accuracy"] * 100).round(0).astype(int).astype(str) + "%"
     st.dataframe(show[["player", "correct", "total", "accuracy"]], hide_index=True, use_container_width=True)
 
+def page_history():
+    require_login()
+    st.title("📜 History")
+
+    scores = read_aggregate("season_scores")
+    if scores.empty:
+        st.info("No archived seasons yet. The host can archive one from the Admin page.")
+        return
+    winners = read_aggregate("season_winners")
+
+    st.subheader("All-time Detectives")
+    ranks = all_time_rankings(scores)
+    ranks["accuracy"] = (ranks["accuracy"] * 100).round(0).astype(int).astype(str) + "%"
+    st.dataframe(ranks[["player", "seasons", "correct", "total", "accuracy", "titles", "podiums"]],
+                 hide_index=True, use_container_width=True)
+
+    st.subheader("Past Superlative Winners")
+    if winners.empty:
+        st.write("No superlative votes archived.")
+    else:
+        show = winners.sort_values(["archived_at", "category"], ascending=[False, True])
+        st.dataframe(show[["season", "category", "nominee", "votes"]], hide_index=True, use_container_width=True)
+
+    st.subheader("Streaks")
+    st.dataframe(player_streaks(scores, winners), hide_index=True, use_container_width=True)
+
 def page_superlatives(sh):
     require_login()
     voter = st.session_state["player"]
@@ -657,25 +877,16 @@ def page_superlatives(sh):
     # winner per category
     winners = res.sort_values(["category", "votes"], ascending=[True, False]).drop_duplicates("category")
 
-    # pretty winner cards
-    for _, w in winners.iterrows():
-        cat = w["category"]
-        nominee = w["nominee"]
-        v = int(w["votes"])
-        st.markdown(f"""
-        <div style="border:1px solid rgba(255,255,255,0.18); border-radius:18px; padding:14px; margin:10px 0;
-                    background: rgba(255,255,255,0.03);">
-          <div style="font-weight:900; font-size:18px;">🏅 {cat}</div>
-          <div style="font-size:22px; font-weight:900; margin-top:6px;">{nominee}</div>
-          <div style="opacity:.8; margin-top:6px;">Votes: <b>{v}</b></div>
-        </div>
-        """, unsafe_allow_html=True)
-
-        # breakdown table for that category
+    # pretty winner cards, one markdown block for all of them
+    cards = tuple((str(w["category"]), str(w["nominee"]), int(w["votes"])) for _, w in winners.iterrows())
+    st.markdown(superlative_cards_html(cards), unsafe_allow_html=True)
+
+    # breakdown table per category
+    for cat, _, _ in cards:
         with st.expander(f"See full votes for {cat}"):
             sub = res[res["category"] == cat].copy()
             st.dataframe(sub[["nominee", "votes"]], hide_index=True, use_container_width=True)
-            
+
 def page_bingo(sh):
     require_login()
     player = st.session_state["player"]
@@ -694,8 +905,6 @@ def page_bingo(sh):
 
     state = get_bingo_state(player)
 
-    st.markdown('<div class="bingo-card">', unsafe_allow_html=True)
-
     # 3x3 grid (row-major)
     for r in range(3):
         cols = st.columns(cols_n)
@@ -706,19 +915,7 @@ def page_bingo(sh):
 
             with cols[c % cols_n]:
                 # Square “card” look
-                cls = "square stamped" if stamped else "square"
-                st.markdown(
-                    f"""
-                    <div class="{cls}">
-                      <div>
-                        <div class="label">{person}</div>
-                        <div class="status">{'✅ STAMPED' if stamped else '⬜ not yet'}</div>
-                      </div>
-                      <div class="small-note">Tap below to toggle</div>
-                    </div>
-                    """,
-                    unsafe_allow_html=True
-                )
+                st.markdown(bingo_square_html(person, stamped), unsafe_allow_html=True)
 
                 # Button stamp (real interaction)
                 btn_label = "Unstamp" if stamped else "Stamp"
@@ -726,10 +923,8 @@ def page_bingo(sh):
                     set_bingo_square(sh, player, person, not stamped)
                     st.rerun()
 
-    st.markdown("</div>", unsafe_allow_html=True)
-
     # Bingo detection
-    current = [get_bingo_state(player).get(p, False) for p in BINGO_PEOPLE]
+    current = [state.get(p, False) for p in BINGO_PEOPLE]
     wins = [
         (0,1,2),(3,4,5),(6,7,8),
         (0,3,6),(1,4,7),(2,5,8),
@@ -762,7 +957,7 @@ if st.sidebar.button("Log out", use_container_width=True):
 
 page = st.sidebar.radio(
     "Go to",
-    ["Guess Board", "Bingo", "Clue Wall", "Leaderboard", "Superlatives", "Admin"],
+    ["Guess Board", "Bingo", "Clue Wall", "Leaderboard", "Superlatives", "History", "Admin"],
     index=0
 )
 
@@ -776,5 +971,7 @@ elif page == "Leaderboard":
     page_leaderboard()
 elif page == "Superlatives":
     page_superlatives(sh)
+elif page == "History":
+    page_history()
 else:
     page_admin(sh)
@@ -0,0 +1,48 @@
+"""How crowd_consensus solve time scales with group size.
+
+Usage: python bench_consensus.py [guesses_per_player]
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from consensus import crowd_consensus, latest_guesses, solve_assignment, weight_matrix
+
+SIZES = [50, 200, 500, 1000, 2000, 4000]
+
+
+def fake_guesses(n: int, per_player: int, rng) -> tuple:
+    names = [f"p{i}" for i in range(n)]
+    rows = n * per_player
+    df = pd.DataFrame({
+        "timestamp": np.arange(rows).astype(str),
+        "player": np.repeat(names, per_player),
+        "giver_guess": rng.choice(names, rows),
+        "receiver_guess": rng.choice(names, rows),
+        "confidence": rng.integers(1, 6, rows),
+    })
+    return df, names
+
+
+def main():
+    per_player = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    rng = np.random.default_rng(0)
+    print(f"{'players':>8} {'guesses':>8} {'matrix ms':>10} {'solve ms':>10} {'total ms':>10}")
+    for n in SIZES:
+        guesses, names = fake_guesses(n, per_player, rng)
+
+        t0 = time.perf_counter()
+        weights = weight_matrix(latest_guesses(guesses), names)
+        t1 = time.perf_counter()
+        solve_assignment(weights)
+        t2 = time.perf_counter()
+        crowd_consensus(guesses, names)
+        t3 = time.perf_counter()
+
+        print(f"{n:>8} {len(guesses):>8} {(t1 - t0) * 1e3:>10.1f} {(t2 - t1) * 1e3:>10.1f} {(t3 - t2) * 1e3:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
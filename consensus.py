@@ -0,0 +1,77 @@
+"""Crowd detective: the single most likely complete Secret Santa assignment.
+
+Kept free of Streamlit so it can be benchmarked on its own
+(see bench_consensus.py).
+"""
+import numpy as np
+import pandas as pd
+from scipy.optimize import linear_sum_assignment
+
+
+def latest_guesses(guesses: pd.DataFrame) -> pd.DataFrame:
+    """One guess per player+receiver (the most recent), same rule as scoring."""
+    if guesses.empty:
+        return guesses
+    guesses = guesses.copy()
+    for col in ["player", "giver_guess", "receiver_guess"]:
+        guesses[col] = guesses[col].astype(str).str.strip()
+    if "timestamp" in guesses.columns:
+        guesses = guesses.sort_values("timestamp")
+    return guesses.drop_duplicates(subset=["player", "receiver_guess"], keep="last")
+
+
+def weight_matrix(guesses: pd.DataFrame, names: list) -> np.ndarray:
+    """givers x receivers matrix of summed confidence across all guessers."""
+    n = len(names)
+    weights = np.zeros((n, n))
+    if guesses.empty:
+        return weights
+
+    pos = {name: i for i, name in enumerate(names)}
+    g = guesses["giver_guess"].map(pos)
+    r = guesses["receiver_guess"].map(pos)
+    conf = pd.to_numeric(guesses.get("confidence", 1), errors="coerce")
+    conf = pd.Series(conf, index=guesses.index).fillna(1).clip(lower=0)
+
+    keep = g.notna() & r.notna() & (g != r)
+    np.add.at(weights, (g[keep].astype(int).to_numpy(), r[keep].astype(int).to_numpy()), conf[keep].to_numpy())
+    return weights
+
+
+def solve_assignment(weights: np.ndarray) -> np.ndarray:
+    """Giver index for each receiver maximising total weight, nobody giving to themselves."""
+    n = weights.shape[0]
+    cost = -weights
+    # any self-gift costs more than every real guess combined
+    np.fill_diagonal(cost, weights.sum() + 1.0)
+    givers, receivers = linear_sum_assignment(cost)
+    out = np.empty(n, dtype=int)
+    out[receivers] = givers
+    return out
+
+
+def crowd_consensus(guesses: pd.DataFrame, names: list) -> pd.DataFrame:
+    """Most likely giver per receiver, with the crowd's certainty in that pick.
+
+    certainty is the chosen giver's share of all confidence placed on that
+    receiver (0 when nobody has guessed them yet).
+    """
+    cols = ["receiver", "giver", "certainty", "support"]
+    if len(names) < 2:
+        return pd.DataFrame(columns=cols)
+
+    latest = latest_guesses(guesses)
+    weights = weight_matrix(latest, names)
+    giver_idx = solve_assignment(weights)
+
+    receivers = np.arange(len(names))
+    chosen = weights[giver_idx, receivers]
+    totals = weights.sum(axis=0)
+    certainty = np.divide(chosen, totals, out=np.zeros_like(chosen), where=totals > 0)
+
+    return pd.DataFrame({
+        "receiver": names,
+        "giver": [names[i] for i in giver_idx],
+        "certainty": certainty,
+        "support": chosen,
+    }).sort_values("certainty", ascending=False).reset_index(drop=True)
@@ -0,0 +1,109 @@
+"""Clue Wall search: an incrementally maintained inverted index over the posts tab.
+
+Kept free of Streamlit so it can be tested on its own (see test_postindex.py).
+"""
+import bisect
+import re
+import threading
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list:
+    return TOKEN_RE.findall(str(text).lower())
+
+
+def parse_ts(value):
+    try:
+        ts = datetime.fromisoformat(str(value).strip())
+    except ValueError:
+        return None
+    return ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
+
+
+def row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """One uint64 per row; compute once per tab refresh and pass it to sync()."""
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+class PostIndex:
+    """Inverted index over the posts tab, shared by every session in the process.
+
+    Post ids are row positions in the sheet. Each sync compares per-row hashes
+    with the rows already indexed: if they still match, only the new rows are
+    indexed; any edit, delete or reorder triggers a rebuild. Sessions only read
+    through search(), author_names() and len(), which take the lock.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self.hashes = np.empty(0, dtype=np.uint64)
+        self.rows = []          # id -> (timestamp str, author, content)
+        self.times = []         # id -> parsed datetime or None
+        self.tokens = {}        # token -> set of ids
+        self.sorted_tokens = [] # for prefix lookups
+        self.authors = {}       # author -> set of ids
+
+    def sync(self, df: pd.DataFrame, hashes=None):
+        if hashes is None:
+            hashes = row_hashes(df)
+        with self.lock:
+            n = len(self.rows)
+            if len(hashes) < n or not np.array_equal(hashes[:n], self.hashes):
+                self._reset()
+            for pid in range(len(self.rows), len(df)):
+                row = df.iloc[pid]
+                ts = str(row.get("timestamp", ""))
+                who = str(row.get("player", "Unknown"))
+                text = str(row.get("content", ""))
+                self.rows.append((ts, who, text))
+                self.times.append(parse_ts(ts))
+                self.authors.setdefault(who, set()).add(pid)
+                for tok in set(tokenize(text)):
+                    if tok not in self.tokens:
+                        self.tokens[tok] = set()
+                        bisect.insort(self.sorted_tokens, tok)
+                    self.tokens[tok].add(pid)
+            self.hashes = np.asarray(hashes)
+
+    def __len__(self):
+        with self.lock:
+            return len(self.rows)
+
+    def author_names(self) -> list:
+        with self.lock:
+            return sorted(self.authors)
+
+    def _prefix_ids(self, prefix: str) -> set:
+        ids = set()
+        i = bisect.bisect_left(self.sorted_tokens, prefix)
+        while i < len(self.sorted_tokens) and self.sorted_tokens[i].startswith(prefix):
+            ids |= self.tokens[self.sorted_tokens[i]]
+            i += 1
+        return ids
+
+    def search(self, query: str = "", authors=None, since=None, limit=None) -> list:
+        """(timestamp, author, content) rows matching every query term as a prefix, newest first."""
+        with self.lock:
+            ids = None
+            for term in tokenize(query):
+                hits = self._prefix_ids(term)
+                ids = hits if ids is None else ids & hits
+                if not ids:
+                    return []
+            if authors:
+                by_author = set().union(*(self.authors.get(a, set()) for a in authors))
+                ids = by_author if ids is None else ids & by_author
+            if ids is None:
+                ids = set(range(len(self.rows)))
+            if since is not None:
+                ids = {i for i in ids if self.times[i] is not None and self.times[i] >= since}
+            ordered = sorted(ids, key=lambda i: self.rows[i][0], reverse=True)
+            return [self.rows[i] for i in ordered[:limit]]
@@ -0,0 +1,84 @@
+"""Archived-season aggregates: atomic parquet writes and all-time history queries.
+
+Kept free of Streamlit so it can be tested on its own (see test_seasons.py).
+Aggregate frames carry `season` and `archived_at` (UTC ISO time of the first
+archive of that season) so seasons order by when they happened, not by label.
+"""
+import os
+import tempfile
+
+import pandas as pd
+
+
+def write_parquet_atomic(df: pd.DataFrame, path: str):
+    """Write to a temp file in the same directory, then swap it in, so readers
+    on the shared volume never see a half-written file."""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".tmp-", suffix=".parquet")
+    os.close(fd)
+    try:
+        df.to_parquet(tmp, compression="zstd", index=False)
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+
+def first_archived_at(path: str, season: str, default: str) -> str:
+    """archived_at already recorded for season in the aggregate at path, else default."""
+    if not os.path.exists(path):
+        return default
+    old = pd.read_parquet(path, columns=["season", "archived_at"])
+    mine = old.loc[old["season"] == season, "archived_at"]
+    return str(mine.min()) if not mine.empty else default
+
+
+def upsert_season(path: str, season: str, rows: pd.DataFrame):
+    """Replace season's rows in the aggregate at path."""
+    if os.path.exists(path):
+        old = pd.read_parquet(path)
+        rows = pd.concat([old[old["season"] != season], rows], ignore_index=True)
+    write_parquet_atomic(rows, path)
+
+
+def season_order(season_scores: pd.DataFrame) -> list:
+    """Season labels, oldest first."""
+    first = season_scores.groupby("season")["archived_at"].min()
+    return first.sort_values(kind="stable").index.tolist()
+
+
+def all_time_rankings(season_scores: pd.DataFrame) -> pd.DataFrame:
+    df = season_scores.copy()
+    df["podium"] = df["rank"] <= 3
+    df["title"] = df["rank"] == 1
+    out = df.groupby("player").agg(
+        seasons=("season", "nunique"),
+        correct=("correct", "sum"),
+        total=("total", "sum"),
+        titles=("title", "sum"),
+        podiums=("podium", "sum"),
+    ).reset_index()
+    out["accuracy"] = (out["correct"] / out["total"].where(out["total"] > 0)).fillna(0.0)
+    return out.sort_values(["correct", "accuracy"], ascending=[False, False]).reset_index(drop=True)
+
+
+def player_streaks(season_scores: pd.DataFrame, winners: pd.DataFrame) -> pd.DataFrame:
+    """Consecutive-season streaks per player: podium finishes and superlative wins."""
+    seasons = season_order(season_scores)
+    on_podium = season_scores[season_scores["rank"] <= 3]
+    podium = set(zip(on_podium["player"], on_podium["season"]))
+    won = set(zip(winners["nominee"], winners["season"])) if not winners.empty else set()
+
+    def streaks(player, hits):
+        best = cur = 0
+        for s in seasons:
+            cur = cur + 1 if (player, s) in hits else 0
+            best = max(best, cur)
+        return best, cur
+
+    rows = []
+    for player in sorted(season_scores["player"].unique()):
+        pb, pc = streaks(player, podium)
+        wb, wc = streaks(player, won)
+        rows.append({"player": player, "best_podium_streak": pb, "current_podium_streak": pc,
+                     "best_superlative_streak": wb, "current_superlative_streak": wc})
+    return pd.DataFrame(rows)
@@ -0,0 +1,138 @@
+"""Tab read cache: a spreadsheet modified-time probe plus an optional SQLite
+store shared by every replica.
+
+Kept free of Streamlit so it can be tested on its own (see test_tabcache.py).
+`fetch` callables download a tab's records; `probe` callables return the
+spreadsheet's current revision ("" when unavailable).
+"""
+import json
+import sqlite3
+import time
+import uuid
+
+SHARED_CACHE_LEASE = 30   # seconds one replica may hold a tab's refresh lock
+SHARED_CACHE_WAIT = 10    # seconds a replica waits for a first-ever fetch
+
+
+def sheet_modified_time(sh) -> str:
+    """Drive modifiedTime of the spreadsheet, fetched fresh on every call."""
+    try:
+        return str(sh.get_lastUpdateTime() or "")
+    except Exception:
+        return ""  # no probe available -> always download
+
+
+def probe_or_fetch(fetch, probe, seen_revision: str, seen_records):
+    """(revision, records): skip the download if the sheet hasn't changed since seen_revision.
+
+    Sheets has no per-tab revision, so any edit to the spreadsheet makes every
+    tab refetch once; the saving is during stretches with no edits at all.
+    """
+    revision = probe()
+    if revision and revision == seen_revision and seen_records is not None:
+        return revision, seen_records
+    return revision, fetch()
+
+
+def local_records(store: dict, tab_name: str, fetch, probe) -> list:
+    """Per-process variant: store maps tab -> (revision, records) of the last download."""
+    seen_revision, seen_records = store.get(tab_name, ("", None))
+    revision, records = probe_or_fetch(fetch, probe, seen_revision, seen_records)
+    store[tab_name] = (revision, records)
+    return records
+
+
+def init_shared_cache(path: str):
+    con = sqlite3.connect(path, timeout=10)
+    with con:
+        con.execute("""
+            CREATE TABLE IF NOT EXISTS tab_cache (
+                tab TEXT PRIMARY KEY,
+                version INTEGER NOT NULL DEFAULT 0,
+                fetched_at REAL NOT NULL DEFAULT 0,
+                records TEXT NOT NULL DEFAULT '[]',
+                lock_owner TEXT,
+                lock_until REAL NOT NULL DEFAULT 0,
+                revision TEXT NOT NULL DEFAULT ''
+            )
+        """)
+        cols = [r[1] for r in con.execute("PRAGMA table_info(tab_cache)")]
+        if "revision" not in cols:  # cache files created before revision probing
+            con.execute("ALTER TABLE tab_cache ADD COLUMN revision TEXT NOT NULL DEFAULT ''")
+    con.close()
+
+
+def shared_records(path: str, tab_name: str, ttl: float, fetch, probe) -> list:
+    """Records for a tab, fetched from Google by at most one replica per ttl.
+
+    Entries are keyed by tab and carry a version that bumps whenever a refresh
+    actually downloads new data (see probe_or_fetch).
+    When an entry expires, one replica takes a short lease and refetches while
+    the others keep serving the stale copy (or wait briefly if there is none).
+    """
+    con = sqlite3.connect(path, timeout=10)
+    try:
+        deadline = time.time() + SHARED_CACHE_WAIT
+        owner = uuid.uuid4().hex
+        while True:
+            now = time.time()
+            row = con.execute(
+                "SELECT version, fetched_at, records, revision FROM tab_cache WHERE tab = ?", (tab_name,)
+            ).fetchone()
+            if row and row[0] and now - row[1] < ttl:
+                return json.loads(row[2])
+
+            # try to become the single replica that refreshes this tab
+            with con:
+                cur = con.execute("""
+                    INSERT INTO tab_cache (tab, lock_owner, lock_until) VALUES (?, ?, ?)
+                    ON CONFLICT(tab) DO UPDATE SET lock_owner = excluded.lock_owner,
+                                                   lock_until = excluded.lock_until
+                    WHERE tab_cache.lock_until < ?
+                """, (tab_name, owner, now + SHARED_CACHE_LEASE, now))
+            if cur.rowcount == 1:
+                break
+
+            # someone else is refreshing: serve stale if we have it
+            if row and row[0]:
+                return json.loads(row[2])
+            if time.time() > deadline:
+                return fetch()
+            time.sleep(0.25)
+
+        seen_records = json.loads(row[2]) if row and row[0] else None
+        try:
+            revision, records = probe_or_fetch(fetch, probe, row[3] if row else "", seen_records)
+        except Exception:
+            with con:
+                con.execute(
+                    "UPDATE tab_cache SET lock_owner = NULL, lock_until = 0 WHERE tab = ? AND lock_owner = ?",
+                    (tab_name, owner),
+                )
+            raise
+
+        with con:
+            if records is seen_records:
+                # unchanged since last download: just extend its freshness
+                con.execute("""
+                    UPDATE tab_cache SET fetched_at = ?, revision = ?, lock_owner = NULL, lock_until = 0
+                    WHERE tab = ?
+                """, (time.time(), revision, tab_name))
+            else:
+                con.execute("""
+                    UPDATE tab_cache
+                    SET version = version + 1, fetched_at = ?, records = ?, revision = ?,
+                        lock_owner = NULL, lock_until = 0
+                    WHERE tab = ?
+                """, (time.time(), json.dumps(records), revision, tab_name))
+        return records
+    finally:
+        con.close()
+
+
+def invalidate_shared(path: str, tab_name: str):
+    """Expire a tab's entry and forget its revision; the records stay as a stale fallback."""
+    con = sqlite3.connect(path, timeout=10)
+    with con:
+        con.execute("UPDATE tab_cache SET fetched_at = 0, revision = '' WHERE tab = ?", (tab_name,))
+    con.close()
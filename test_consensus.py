@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+
+from consensus import crowd_consensus, latest_guesses, solve_assignment, weight_matrix
+
+NAMES = ["a", "b", "c"]
+
+
+def guesses(*rows):
+    """rows = (timestamp, player, giver_guess, receiver_guess, confidence)."""
+    return pd.DataFrame(rows, columns=["timestamp", "player", "giver_guess", "receiver_guess", "confidence"])
+
+
+def picks(result):
+    return dict(zip(result["receiver"], result["giver"]))
+
+
+def test_solve_never_assigns_self_even_with_zero_weights():
+    for n in [2, 3, 7]:
+        givers = solve_assignment(np.zeros((n, n)))
+        assert sorted(givers) == list(range(n))
+        assert all(givers[r] != r for r in range(n))
+
+
+def test_solve_never_assigns_self_when_diagonal_is_heaviest():
+    weights = np.eye(4) * 100 + 1
+    givers = solve_assignment(weights)
+    assert all(givers[r] != r for r in range(4))
+
+
+def test_highest_total_confidence_assignment_wins_over_greedy():
+    # greedy would take b->a (5) and force the weaker cycle (5+1+1=7);
+    # the optimal cycle c->a, a->b, b->c scores 4+3+3=10
+    result = crowd_consensus(guesses(
+        ("1", "p1", "b", "a", 5), ("2", "p2", "c", "b", 1), ("3", "p3", "a", "c", 1),
+        ("4", "p4", "c", "a", 4), ("5", "p5", "a", "b", 3), ("6", "p6", "b", "c", 3),
+    ), NAMES)
+    assert picks(result) == {"a": "c", "b": "a", "c": "b"}
+
+
+def test_only_latest_guess_per_player_and_receiver_counts():
+    df = guesses(
+        ("2025-12-24T18:00", "p1", "b", "a", 5),
+        ("2025-12-24T19:00", "p1", "c", "a", 2),  # p1 changed their mind
+        ("2025-12-24T18:30", "p2", "b", "c", 1),
+    )
+    latest = latest_guesses(df)
+    assert len(latest) == 2
+    weights = weight_matrix(latest, NAMES)
+    assert weights[1, 0] == 0 and weights[2, 0] == 2
+    assert picks(crowd_consensus(df, NAMES))["a"] == "c"
+
+
+def test_certainty_is_share_and_zero_when_unguessed():
+    result = crowd_consensus(guesses(
+        ("1", "p1", "b", "a", 3), ("2", "p2", "c", "a", 1),
+    ), NAMES).set_index("receiver")
+    assert result.loc["a", "giver"] == "b"
+    assert result.loc["a", "certainty"] == 0.75
+    assert result.loc["b", "certainty"] == 0.0
+    assert result.loc["c", "certainty"] == 0.0
+
+
+def test_missing_confidence_column_defaults_to_one():
+    df = guesses(("1", "p1", "b", "a", 0), ("2", "p2", "b", "a", 0), ("3", "p3", "c", "b", 0))
+    df = df.drop(columns=["confidence"])
+    weights = weight_matrix(latest_guesses(df), NAMES)
+    assert weights[1, 0] == 2 and weights[2, 1] == 1
+
+
+def test_unknown_names_and_self_guesses_are_ignored():
+    weights = weight_matrix(guesses(("1", "p1", "zed", "a", 5), ("2", "p2", "a", "a", 5)), NAMES)
+    assert weights.sum() == 0
+
+
+def test_fewer_than_two_players_is_empty():
+    assert crowd_consensus(guesses(), ["a"]).empty
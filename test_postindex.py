@@ -0,0 +1,83 @@
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from postindex import PostIndex
+
+
+def posts(*rows):
+    return pd.DataFrame(rows, columns=["timestamp", "player", "content"])
+
+
+def feed(n):
+    return posts(*[(f"2025-12-24T18:{i:02d}:00+00:00", f"p{i % 3}", f"clue number {i}") for i in range(n)])
+
+
+def texts(rows):
+    return [r[2] for r in rows]
+
+
+def test_prefix_match_requires_every_term():
+    index = PostIndex()
+    index.sync(posts(
+        ("2025-12-24T18:00:00+00:00", "Gabby", "My santa loves shrimp"),
+        ("2025-12-24T18:01:00+00:00", "Diego", "Shrimp? Suspicious santa"),
+        ("2025-12-24T18:02:00+00:00", "Luzma", "wears red socks"),
+    ))
+    assert texts(index.search("shr")) == ["Shrimp? Suspicious santa", "My santa loves shrimp"]
+    assert texts(index.search("shr lov")) == ["My santa loves shrimp"]
+    assert index.search("pasta") == []
+    assert len(index.search("")) == 3
+
+
+def test_author_and_time_filters():
+    index = PostIndex()
+    index.sync(posts(
+        ("2025-12-24T18:00:00+00:00", "Gabby", "first clue"),
+        ("2025-12-24T20:00:00+00:00", "Gabby", "second clue"),
+        ("2025-12-24T20:30:00+00:00", "Anonymous", "third clue"),
+        ("not a time", "Gabby", "undated clue"),
+    ))
+    assert texts(index.search("clue", authors=["Gabby"])) == ["undated clue", "second clue", "first clue"]
+    since = datetime(2025, 12, 24, 19, 0, tzinfo=timezone.utc)
+    assert texts(index.search("clue", since=since)) == ["third clue", "second clue"]
+    assert texts(index.search("", authors=["Gabby"], since=since)) == ["second clue"]
+    assert index.author_names() == ["Anonymous", "Gabby"]
+
+
+def test_appends_are_indexed_incrementally():
+    index = PostIndex()
+    index.sync(feed(5))
+    tokens_before = index.tokens["clue"]
+    index.sync(feed(8))
+    assert len(index) == 8
+    assert index.tokens["clue"] is tokens_before  # extended, not rebuilt
+    assert texts(index.search("7")) == ["clue number 7"]
+
+
+def test_edit_in_the_middle_triggers_rebuild():
+    index = PostIndex()
+    df = feed(50)
+    index.sync(df)
+    df.loc[30, "content"] = "pine tree clue"
+    index.sync(df)
+    assert texts(index.search("pine")) == ["pine tree clue"]
+    assert index.search("30") == []
+
+
+def test_delete_then_regrow_past_old_length_rebuilds():
+    index = PostIndex()
+    index.sync(feed(10))
+    regrown = pd.concat([feed(10).drop(index=[2]), posts(("2025-12-24T19:00:00+00:00", "p9", "late clue"),
+                                                         ("2025-12-24T19:01:00+00:00", "p9", "later clue"))],
+                        ignore_index=True)
+    index.sync(regrown)
+    assert len(index) == 11
+    assert index.search("2") == []
+    assert texts(index.search("lat")) == ["later clue", "late clue"]
+
+
+def test_search_limit():
+    index = PostIndex()
+    index.sync(feed(10))
+    assert texts(index.search("clue", limit=2)) == ["clue number 9", "clue number 8"]
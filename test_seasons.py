@@ -0,0 +1,86 @@
+import os
+
+import pandas as pd
+
+from seasons import (all_time_rankings, first_archived_at, player_streaks, season_order,
+                     upsert_season, write_parquet_atomic)
+
+
+def season(label, archived_at, ranking):
+    """ranking = [(player, correct, total), ...] best first."""
+    return pd.DataFrame([
+        {"season": label, "archived_at": archived_at, "player": p, "correct": c, "total": t,
+         "accuracy": c / t if t else 0.0, "rank": i}
+        for i, (p, c, t) in enumerate(ranking, start=1)
+    ])
+
+
+# labels deliberately sort differently from the order the seasons happened in
+SCORES = pd.concat([
+    season("xmas23", "2023-12-25T00:00:00+00:00", [("Gabby", 3, 4), ("Diego", 2, 4), ("Luzma", 1, 4), ("Cesar", 0, 0)]),
+    season("2024", "2024-12-25T00:00:00+00:00", [("Diego", 4, 4), ("Gabby", 2, 4), ("Cesar", 1, 4), ("Luzma", 0, 4)]),
+    season("a-2025", "2025-12-25T00:00:00+00:00", [("Gabby", 4, 5), ("Luzma", 3, 5), ("Diego", 1, 5), ("Cesar", 0, 5)]),
+], ignore_index=True)
+
+WINNERS = pd.DataFrame([
+    {"season": "xmas23", "archived_at": "2023-12-25T00:00:00+00:00", "category": "Chaos", "nominee": "Luzma", "votes": 4},
+    {"season": "2024", "archived_at": "2024-12-25T00:00:00+00:00", "category": "Chaos", "nominee": "Luzma", "votes": 5},
+    {"season": "a-2025", "archived_at": "2025-12-25T00:00:00+00:00", "category": "Chaos", "nominee": "Diego", "votes": 3},
+])
+
+
+def test_season_order_uses_archive_time_not_label():
+    assert season_order(SCORES) == ["xmas23", "2024", "a-2025"]
+
+
+def test_all_time_rankings_sums_across_seasons():
+    ranks = all_time_rankings(SCORES).set_index("player")
+    assert ranks.index[0] == "Gabby"
+    assert ranks.loc["Gabby", ["seasons", "correct", "total", "titles", "podiums"]].tolist() == [3, 9, 13, 2, 3]
+    assert ranks.loc["Diego", "titles"] == 1
+    assert ranks.loc["Cesar", "podiums"] == 1
+    assert ranks.loc["Diego", "accuracy"] == 7 / 13
+
+
+def test_all_time_rankings_zero_total_is_zero_accuracy():
+    ranks = all_time_rankings(season("x", "2025-01-01", [("Solo", 0, 0)]))
+    assert ranks.loc[0, "accuracy"] == 0.0
+
+
+def test_player_streaks_follow_chronological_order():
+    streaks = player_streaks(SCORES, WINNERS).set_index("player")
+    # Gabby: podium in xmas23, 2024, a-2025
+    assert streaks.loc["Gabby", ["best_podium_streak", "current_podium_streak"]].tolist() == [3, 3]
+    # Luzma: podium xmas23, off in 2024, podium a-2025
+    assert streaks.loc["Luzma", ["best_podium_streak", "current_podium_streak"]].tolist() == [1, 1]
+    # Luzma won Chaos in xmas23 and 2024, then lost it in a-2025
+    assert streaks.loc["Luzma", ["best_superlative_streak", "current_superlative_streak"]].tolist() == [2, 0]
+    assert streaks.loc["Diego", ["best_superlative_streak", "current_superlative_streak"]].tolist() == [1, 1]
+
+
+def test_player_streaks_without_winners():
+    streaks = player_streaks(SCORES, pd.DataFrame())
+    assert streaks["best_superlative_streak"].eq(0).all()
+
+
+def test_write_parquet_atomic_replaces_without_leftovers(tmp_path):
+    path = str(tmp_path / "season_scores.parquet")
+    write_parquet_atomic(SCORES.head(2), path)
+    write_parquet_atomic(SCORES, path)
+    assert len(pd.read_parquet(path)) == len(SCORES)
+    assert os.listdir(tmp_path) == ["season_scores.parquet"]
+
+
+def test_upsert_season_keeps_first_archive_time(tmp_path):
+    path = str(tmp_path / "season_scores.parquet")
+    upsert_season(path, "xmas23", SCORES[SCORES["season"] == "xmas23"])
+    upsert_season(path, "2024", SCORES[SCORES["season"] == "2024"])
+
+    assert first_archived_at(path, "xmas23", "now") == "2023-12-25T00:00:00+00:00"
+    assert first_archived_at(path, "2099", "now") == "now"
+
+    redo = season("xmas23", first_archived_at(path, "xmas23", "now"), [("Gabby", 4, 4)])
+    upsert_season(path, "xmas23", redo)
+    stored = pd.read_parquet(path)
+    assert len(stored[stored["season"] == "xmas23"]) == 1
+    assert season_order(stored) == ["xmas23", "2024"]
@@ -0,0 +1,91 @@
+import tabcache
+
+
+class FakeWorksheet:
+    def __init__(self, sheet, name):
+        self.sheet, self.name = sheet, name
+
+    def get_all_records(self):
+        self.sheet.downloads += 1
+        return list(self.sheet.tabs[self.name])
+
+
+class FakeSpreadsheet:
+    """Mimics gspread: lastUpdateTime is frozen at open, get_lastUpdateTime() is live."""
+
+    def __init__(self, tabs):
+        self.tabs = tabs
+        self.modified = "2025-12-24T18:00:00.000Z"
+        self.lastUpdateTime = self.modified
+        self.downloads = 0
+
+    def get_lastUpdateTime(self):
+        return self.modified
+
+    def worksheet(self, name):
+        return FakeWorksheet(self, name)
+
+    def edit(self, name, rows, modified):
+        self.tabs[name] = rows
+        self.modified = modified
+
+
+def readers(sh, tab):
+    return (lambda: sh.worksheet(tab).get_all_records(),
+            lambda: tabcache.sheet_modified_time(sh))
+
+
+def test_local_records_refetch_only_when_sheet_changes():
+    sh = FakeSpreadsheet({"posts": [{"content": "a"}]})
+    fetch, probe = readers(sh, "posts")
+    store = {}
+
+    assert tabcache.local_records(store, "posts", fetch, probe) == [{"content": "a"}]
+    assert tabcache.local_records(store, "posts", fetch, probe) == [{"content": "a"}]
+    assert sh.downloads == 1
+
+    sh.edit("posts", [{"content": "a"}, {"content": "b"}], "2025-12-24T18:05:00.000Z")
+    assert tabcache.local_records(store, "posts", fetch, probe) == [{"content": "a"}, {"content": "b"}]
+    assert sh.downloads == 2
+
+
+def test_shared_records_refetch_only_when_sheet_changes(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    tabcache.init_shared_cache(path)
+    sh = FakeSpreadsheet({"app_state": [{"key": "locked", "value": "FALSE"}]})
+    fetch, probe = readers(sh, "app_state")
+
+    # ttl=0: every read is an expired entry, so only the probe can save a download
+    assert tabcache.shared_records(path, "app_state", 0, fetch, probe)[0]["value"] == "FALSE"
+    assert tabcache.shared_records(path, "app_state", 0, fetch, probe)[0]["value"] == "FALSE"
+    assert sh.downloads == 1
+
+    sh.edit("app_state", [{"key": "locked", "value": "TRUE"}], "2025-12-24T18:05:00.000Z")
+    assert tabcache.shared_records(path, "app_state", 0, fetch, probe)[0]["value"] == "TRUE"
+    assert sh.downloads == 2
+
+
+def test_missing_probe_always_downloads():
+    sh = FakeSpreadsheet({"players": [{"name": "Gabby"}]})
+    fetch, _ = readers(sh, "players")
+    store = {}
+    for _ in range(3):
+        tabcache.local_records(store, "players", fetch, lambda: "")
+    assert sh.downloads == 3
+
+
+def test_invalidate_shared_forces_next_read_to_download(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    tabcache.init_shared_cache(path)
+    sh = FakeSpreadsheet({"app_state": [{"key": "locked", "value": "FALSE"}]})
+    fetch, probe = readers(sh, "app_state")
+
+    tabcache.shared_records(path, "app_state", 60, fetch, probe)
+    tabcache.shared_records(path, "app_state", 60, fetch, probe)
+    assert sh.downloads == 1
+
+    # our own write; the probe may still report the old modified time for a while
+    sh.tabs["app_state"] = [{"key": "locked", "value": "TRUE"}]
+    tabcache.invalidate_shared(path, "app_state")
+    assert tabcache.shared_records(path, "app_state", 60, fetch, probe)[0]["value"] == "TRUE"
+    assert sh.downloads == 2